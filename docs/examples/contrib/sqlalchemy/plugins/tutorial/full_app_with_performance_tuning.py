@@ -0,0 +1,135 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from litestar import Litestar, Request, get, post, put
+from litestar.datastructures import State
+from litestar.exceptions import ClientException, NotFoundException
+from litestar.status_codes import HTTP_409_CONFLICT
+
+TodoType = Dict[str, Any]
+TodoCollectionType = List[TodoType]
+
+
+class Base(DeclarativeBase): ...
+
+
+class TodoItem(Base):
+    __tablename__ = "todo_items"
+
+    title: Mapped[str] = mapped_column(primary_key=True)
+    done: Mapped[bool]
+
+
+def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+@asynccontextmanager
+async def db_connection(app: Litestar) -> AsyncGenerator[None, None]:
+    engine = getattr(app.state, "engine", None)
+    if engine is None:
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///todo.sqlite",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=10,
+            max_overflow=20,
+            pool_use_lifo=True,
+        )
+        event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+        app.state.engine = engine
+
+    app.state.sessionmaker = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    try:
+        yield
+    finally:
+        await engine.dispose()
+
+
+async def provide_transaction(state: State, request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with state.sessionmaker() as session:
+        try:
+            async with session.begin():
+                yield session
+        except IntegrityError as exc:
+            raise ClientException(
+                status_code=HTTP_409_CONFLICT,
+                detail=str(exc),
+            ) from exc
+
+        if session.info.get("todos_changed"):
+            await request.app.response_cache_config.get_store_from_app(request.app).delete_all()
+
+
+def serialize_todo(todo: TodoItem) -> TodoType:
+    return {"title": todo.title, "done": todo.done}
+
+
+async def get_todo_list(done: Optional[bool], session: AsyncSession) -> TodoCollectionType:
+    query = select(TodoItem.title, TodoItem.done)
+    if done is not None:
+        query = query.where(TodoItem.done.is_(done))
+
+    result = await session.stream(query)
+    return [{"title": title, "done": is_done} async for title, is_done in result]
+
+
+@get("/", cache=60)
+async def get_list(transaction: AsyncSession, done: Optional[bool] = None) -> TodoCollectionType:
+    return await get_todo_list(done, transaction)
+
+
+@post("/")
+async def add_item(
+    data: Union[TodoType, TodoCollectionType], transaction: AsyncSession
+) -> Union[TodoType, TodoCollectionType]:
+    if isinstance(data, list):
+        new_todos = [{"title": todo["title"], "done": todo["done"]} for todo in data]
+        if new_todos:
+            await transaction.execute(insert(TodoItem), new_todos)
+            transaction.info["todos_changed"] = True
+        return new_todos
+
+    new_todo = TodoItem(title=data["title"], done=data["done"])
+    transaction.add(new_todo)
+    transaction.info["todos_changed"] = True
+    return serialize_todo(new_todo)
+
+
+@put("/{item_title:str}")
+async def update_item(item_title: str, data: TodoType, transaction: AsyncSession) -> TodoType:
+    query = (
+        update(TodoItem)
+        .where(TodoItem.title == item_title)
+        .values(title=data["title"], done=data["done"])
+        .returning(TodoItem.title, TodoItem.done)
+    )
+    result = await transaction.execute(query)
+    if (row := result.first()) is None:
+        raise NotFoundException(detail=f"TODO {item_title!r} not found")
+
+    transaction.info["todos_changed"] = True
+    title, is_done = row
+    return {"title": title, "done": is_done}
+
+
+app = Litestar(
+    [get_list, add_item, update_item],
+    dependencies={"transaction": provide_transaction},
+    lifespan=[db_connection],
+)
@@ -1,5 +1,4 @@
-from dataclasses import dataclass
-
+from msgspec import Struct
 from typing_extensions import Annotated
 
 from litestar import Litestar, post
@@ -7,8 +6,7 @@ from litestar.enums import RequestEncodingType
 from litestar.params import Body
 
 
-@dataclass
-class User:
+class User(Struct):
     id: int
     name: str
 
@@ -0,0 +1,78 @@
+from os import environ
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, EmailStr
+
+from litestar import Litestar, Request, Response, get, post, put
+from litestar.connection import ASGIConnection
+from litestar.security.jwt import JWTAuth, Token
+
+
+class User(BaseModel):
+    id: UUID
+    name: str
+    email: EmailStr
+
+
+MOCK_DB: Dict[str, User] = {}
+
+# Users that have been retrieved recently, mapped to by their id and stored together with the time they expire.
+# The cache is bounded, so that it doesn't grow with the number of users that have ever logged in.
+USER_CACHE: Dict[str, Tuple[float, User]] = {}
+USER_CACHE_TTL = 60
+USER_CACHE_SIZE = 10_000
+
+
+async def get_user_from_db(user_id: str) -> Optional[User]:
+    # logic here to retrieve the user instance, e.g. by querying a database
+    return MOCK_DB.get(user_id)
+
+
+async def retrieve_user_handler(token: Token, connection: "ASGIConnection[Any, Any, Any, Any]") -> Optional[User]:
+    now = monotonic()
+    if (cached := USER_CACHE.get(token.sub)) is not None:
+        expires_at, user = cached
+        if expires_at > now:
+            return user
+        del USER_CACHE[token.sub]
+
+    if (user := await get_user_from_db(token.sub)) is not None:
+        if len(USER_CACHE) >= USER_CACHE_SIZE:
+            # dictionaries preserve the insertion order, so the first key is the oldest entry
+            del USER_CACHE[next(iter(USER_CACHE))]
+        USER_CACHE[token.sub] = (now + USER_CACHE_TTL, user)
+    return user
+
+
+jwt_auth = JWTAuth[User](
+    retrieve_user_handler=retrieve_user_handler,
+    token_secret=environ.get("JWT_SECRET", "abcd123"),
+    exclude=["/login", "/schema"],
+)
+
+
+@post("/login")
+async def login_handler(data: User) -> Response[User]:
+    MOCK_DB[str(data.id)] = data
+    return jwt_auth.login(identifier=str(data.id), response_body=data)
+
+
+@put("/me")
+async def update_user_handler(data: User, request: "Request[User, Token, Any]") -> User:
+    user = MOCK_DB[request.auth.sub] = request.user.model_copy(update={"name": data.name, "email": data.email})
+    # evict the changed user from the cache, so that the next request retrieves the updated user
+    USER_CACHE.pop(request.auth.sub, None)
+    return user
+
+
+@get("/some-path", sync_to_thread=False)
+def some_route_handler(request: "Request[User, Token, Any]") -> Dict[str, str]:
+    return {"name": request.user.name}
+
+
+app = Litestar(
+    route_handlers=[login_handler, update_user_handler, some_route_handler],
+    on_app_init=[jwt_auth.on_app_init],
+)
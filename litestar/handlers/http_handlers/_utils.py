@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import ast
 from functools import lru_cache
-from inspect import isawaitable
+from inspect import getclosurevars, getsource, isawaitable, unwrap
+from textwrap import dedent
 from typing import TYPE_CHECKING, Any, Sequence, cast
 
 from litestar.enums import HttpMethod
@@ -9,13 +11,21 @@ from litestar.exceptions import ValidationException
 from litestar.response import Response
 from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT
 from litestar.types.builtin_types import NoneType
+from litestar.utils.helpers import unwrap_partial
 
 if TYPE_CHECKING:
     from litestar.app import Litestar
     from litestar.background_tasks import BackgroundTask, BackgroundTasks
     from litestar.connection import Request
     from litestar.datastructures import Cookie, ResponseHeader
-    from litestar.types import AfterRequestHookHandler, ASGIApp, AsyncAnyCallable, Method, TypeEncodersMap
+    from litestar.types import (
+        AfterRequestHookHandler,
+        AnyCallable,
+        ASGIApp,
+        AsyncAnyCallable,
+        Method,
+        TypeEncodersMap,
+    )
     from litestar.typing import FieldDefinition
 
 __all__ = (
@@ -24,6 +34,7 @@ __all__ = (
     "create_response_handler",
     "get_default_status_code",
     "is_empty_response_annotation",
+    "is_static_response_fn",
     "normalize_headers",
     "normalize_http_method",
 )
@@ -218,4 +229,106 @@ def is_empty_response_annotation(return_annotation: FieldDefinition) -> bool:
     )
 
 
+def _is_literal_node(node: ast.expr) -> bool:
+    """Return whether an AST expression node is a literal value.
+
+    Args:
+        node: An AST expression node.
+
+    Returns:
+        Whether the node is a constant, a negated constant or a container of literals.
+    """
+    if isinstance(node, ast.Constant):
+        return True
+    if isinstance(node, ast.UnaryOp):
+        return isinstance(node.operand, ast.Constant)
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        return all(_is_literal_node(element) for element in node.elts)
+    if isinstance(node, ast.Dict):
+        return all(key is not None and _is_literal_node(key) for key in node.keys) and all(
+            _is_literal_node(value) for value in node.values
+        )
+    return False
+
+
+def _resolve_name_node(node: ast.expr, namespace: dict[str, Any]) -> Any:
+    """Resolve a name or a dotted attribute access against a namespace.
+
+    Args:
+        node: An AST expression node.
+        namespace: A mapping of names to the values they refer to.
+
+    Returns:
+        The value the node refers to, or ``None`` if it cannot be resolved.
+    """
+    if isinstance(node, ast.Name):
+        return namespace.get(node.id)
+    if isinstance(node, ast.Attribute) and (value := _resolve_name_node(node.value, namespace)) is not None:
+        return getattr(value, node.attr, None)
+    return None
+
+
+def _is_literal_response_call(node: ast.expr, namespace: dict[str, Any]) -> bool:
+    """Return whether an AST expression node is a call to :class:`Response <litestar.response.Response>` with only
+    literal arguments.
+
+    Args:
+        node: An AST expression node.
+        namespace: A mapping of the names referenced by the function to the values they refer to.
+
+    Returns:
+        Whether the node constructs a ``Response`` from literal values.
+    """
+    if not isinstance(node, ast.Call):
+        return False
+
+    return (
+        _resolve_name_node(node.func, namespace) is Response
+        and all(_is_literal_node(arg) for arg in node.args)
+        and all(keyword.arg is not None and _is_literal_node(keyword.value) for keyword in node.keywords)
+    )
+
+
+def is_static_response_fn(fn: AnyCallable) -> bool:
+    """Determine whether a handler function always returns the same literal value.
+
+    The function qualifies if its body, ignoring a docstring, consists of a single ``return`` statement whose value is
+    a literal or a call to :class:`Response <litestar.response.Response>` with only literal arguments. Any function
+    whose source cannot be retrieved, that wraps another function or that deviates from this shape does not qualify.
+
+    Args:
+        fn: A handler function.
+
+    Returns:
+        Whether the function's return value is static.
+    """
+    fn = unwrap_partial(fn)
+    # the source of a wrapper created with 'functools.wraps' is looked up from the wrapped function, which doesn't
+    # tell anything about what the wrapper does
+    if unwrap(fn) is not fn:
+        return False
+
+    try:
+        module = ast.parse(dedent(getsource(fn)))
+        closure_vars = getclosurevars(fn)
+    except (OSError, TypeError, SyntaxError):
+        return False
+
+    if not module.body or not isinstance(function_def := module.body[0], (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return False
+
+    body = function_def.body
+    if len(body) > 1 and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        body = body[1:]
+
+    if len(body) != 1 or not isinstance(statement := body[0], ast.Return):
+        return False
+
+    if statement.value is None or _is_literal_node(statement.value):
+        return True
+
+    namespace = {**closure_vars.builtins, **closure_vars.globals, **closure_vars.nonlocals}
+    return _is_literal_response_call(statement.value, namespace)
+
+
 HTTP_METHOD_NAMES = {m.value for m in HttpMethod}
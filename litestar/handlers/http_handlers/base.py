@@ -19,6 +19,7 @@ from litestar.handlers.http_handlers._utils import (
     create_response_handler,
     get_default_status_code,
     is_empty_response_annotation,
+    is_static_response_fn,
     normalize_http_method,
 )
 from litestar.openapi.spec import Operation
@@ -94,6 +95,7 @@ class HTTPRouteHandler(BaseRouteHandler):
         "deprecated",
         "description",
         "etag",
+        "has_static_response",
         "has_sync_callable",
         "http_methods",
         "include_in_schema",
@@ -108,6 +110,7 @@ class HTTPRouteHandler(BaseRouteHandler):
         "response_headers",
         "responses",
         "security",
+        "static_response",
         "status_code",
         "summary",
         "sync_to_thread",
@@ -115,6 +118,7 @@ class HTTPRouteHandler(BaseRouteHandler):
         "template_name",
     )
 
+    has_static_response: bool
     has_sync_callable: bool
 
     def __init__(
@@ -143,6 +147,7 @@ class HTTPRouteHandler(BaseRouteHandler):
         response_cookies: ResponseCookies | None = None,
         response_headers: ResponseHeaders | None = None,
         return_dto: type[AbstractDTO] | None | EmptyType = Empty,
+        static_response: bool = False,
         status_code: int | None = None,
         sync_to_thread: bool | None = None,
         # OpenAPI related attributes
@@ -214,6 +219,10 @@ class HTTPRouteHandler(BaseRouteHandler):
             return_dto: :class:`AbstractDTO <.dto.base_dto.AbstractDTO>` to use for serializing
                 outbound response data.
             signature_namespace: A mapping of names to types for use in forward reference resolution during signature modelling.
+            static_response: Opt in to replaying the first response of the handler, instead of calling the handler
+                function for every request. Only takes effect if the function takes no parameters and consists of a
+                single ``return`` of literal values or of a :class:`Response <.response.Response>` built from literal
+                values, and if no hooks, caching, background tasks, return DTO or custom response class apply.
             status_code: An http status code for the response. Defaults to ``200`` for mixed method or ``GET``, ``PUT`` and
                 ``PATCH``, ``201`` for ``POST`` and ``204`` for ``DELETE``.
             sync_to_thread: A boolean dictating whether the handler function will be executed in a worker thread or the
@@ -272,6 +281,7 @@ class HTTPRouteHandler(BaseRouteHandler):
         self.response_cookies: Sequence[Cookie] | None = narrow_response_cookies(response_cookies)
         self.response_headers: Sequence[ResponseHeader] | None = narrow_response_headers(response_headers)
 
+        self.static_response = static_response
         self.sync_to_thread = sync_to_thread
         # OpenAPI related attributes
         self.content_encoding = content_encoding
@@ -561,6 +571,17 @@ class HTTPRouteHandler(BaseRouteHandler):
         self.resolve_after_response()
         self.resolve_include_in_schema()
         self.has_sync_callable = not is_async_callable(self.fn)
+        self.has_static_response = (
+            self.static_response
+            and self.resolve_response_class() is Response
+            and not self.parsed_fn_signature.parameters
+            and not self.cache
+            and not self.background
+            and not self.resolve_before_request()
+            and not self.resolve_return_dto()
+            and not any(layer.after_request for layer in self.ownership_layers)
+            and is_static_response_fn(self.fn)
+        )
 
         if self.has_sync_callable and self.sync_to_thread:
             self._fn = ensure_async_callable(self.fn)
@@ -87,6 +87,7 @@ class delete(HTTPRouteHandler):
         response_headers: ResponseHeaders | None = None,
         return_dto: type[AbstractDTO] | None | EmptyType = Empty,
         signature_namespace: Mapping[str, Any] | None = None,
+        static_response: bool = False,
         status_code: int | None = None,
         sync_to_thread: bool | None = None,
         # OpenAPI related attributes
@@ -156,6 +157,10 @@ class delete(HTTPRouteHandler):
             return_dto: :class:`AbstractDTO <.dto.base_dto.AbstractDTO>` to use for serializing
                 outbound response data.
             signature_namespace: A mapping of names to types for use in forward reference resolution during signature modelling.
+            static_response: Opt in to replaying the first response of the handler, instead of calling the handler
+                function for every request. Only takes effect if the function takes no parameters and consists of a
+                single ``return`` of literal values or of a :class:`Response <.response.Response>` built from literal
+                values, and if no hooks, caching, background tasks, return DTO or custom response class apply.
             status_code: An http status code for the response. Defaults to ``200`` for mixed method or ``GET``, ``PUT``
                 and ``PATCH``, ``201`` for ``POST`` and ``204`` for ``DELETE``.
             sync_to_thread: A boolean dictating whether the handler function will be executed in a worker thread or the
@@ -217,6 +222,7 @@ class delete(HTTPRouteHandler):
             return_dto=return_dto,
             security=security,
             signature_namespace=signature_namespace,
+            static_response=static_response,
             status_code=status_code,
             summary=summary,
             sync_to_thread=sync_to_thread,
@@ -262,6 +268,7 @@ class get(HTTPRouteHandler):
         response_headers: ResponseHeaders | None = None,
         return_dto: type[AbstractDTO] | None | EmptyType = Empty,
         signature_namespace: Mapping[str, Any] | None = None,
+        static_response: bool = False,
         status_code: int | None = None,
         sync_to_thread: bool | None = None,
         # OpenAPI related attributes
@@ -331,6 +338,10 @@ class get(HTTPRouteHandler):
             return_dto: :class:`AbstractDTO <.dto.base_dto.AbstractDTO>` to use for serializing
                 outbound response data.
             signature_namespace: A mapping of names to types for use in forward reference resolution during signature modelling.
+            static_response: Opt in to replaying the first response of the handler, instead of calling the handler
+                function for every request. Only takes effect if the function takes no parameters and consists of a
+                single ``return`` of literal values or of a :class:`Response <.response.Response>` built from literal
+                values, and if no hooks, caching, background tasks, return DTO or custom response class apply.
             status_code: An http status code for the response. Defaults to ``200`` for mixed method or ``GET``, ``PUT`` and
                 ``PATCH``, ``201`` for ``POST`` and ``204`` for ``DELETE``.
             sync_to_thread: A boolean dictating whether the handler function will be executed in a worker thread or the
@@ -393,6 +404,7 @@ class get(HTTPRouteHandler):
             return_dto=return_dto,
             security=security,
             signature_namespace=signature_namespace,
+            static_response=static_response,
             status_code=status_code,
             summary=summary,
             sync_to_thread=sync_to_thread,
@@ -437,6 +449,7 @@ class head(HTTPRouteHandler):
         response_cookies: ResponseCookies | None = None,
         response_headers: ResponseHeaders | None = None,
         signature_namespace: Mapping[str, Any] | None = None,
+        static_response: bool = False,
         status_code: int | None = None,
         sync_to_thread: bool | None = None,
         # OpenAPI related attributes
@@ -511,6 +524,10 @@ class head(HTTPRouteHandler):
             return_dto: :class:`AbstractDTO <.dto.base_dto.AbstractDTO>` to use for serializing
                 outbound response data.
             signature_namespace: A mapping of names to types for use in forward reference resolution during signature modelling.
+            static_response: Opt in to replaying the first response of the handler, instead of calling the handler
+                function for every request. Only takes effect if the function takes no parameters and consists of a
+                single ``return`` of literal values or of a :class:`Response <.response.Response>` built from literal
+                values, and if no hooks, caching, background tasks, return DTO or custom response class apply.
             status_code: An http status code for the response. Defaults to ``200`` for mixed method or ``GET``, ``PUT`` and
                 ``PATCH``, ``201`` for ``POST`` and ``204`` for ``DELETE``.
             sync_to_thread: A boolean dictating whether the handler function will be executed in a worker thread or the
@@ -573,6 +590,7 @@ class head(HTTPRouteHandler):
             return_dto=return_dto,
             security=security,
             signature_namespace=signature_namespace,
+            static_response=static_response,
             status_code=status_code,
             summary=summary,
             sync_to_thread=sync_to_thread,
@@ -633,6 +651,7 @@ class patch(HTTPRouteHandler):
         response_headers: ResponseHeaders | None = None,
         return_dto: type[AbstractDTO] | None | EmptyType = Empty,
         signature_namespace: Mapping[str, Any] | None = None,
+        static_response: bool = False,
         status_code: int | None = None,
         sync_to_thread: bool | None = None,
         # OpenAPI related attributes
@@ -702,6 +721,10 @@ class patch(HTTPRouteHandler):
             return_dto: :class:`AbstractDTO <.dto.base_dto.AbstractDTO>` to use for serializing
                 outbound response data.
             signature_namespace: A mapping of names to types for use in forward reference resolution during signature modelling.
+            static_response: Opt in to replaying the first response of the handler, instead of calling the handler
+                function for every request. Only takes effect if the function takes no parameters and consists of a
+                single ``return`` of literal values or of a :class:`Response <.response.Response>` built from literal
+                values, and if no hooks, caching, background tasks, return DTO or custom response class apply.
             status_code: An http status code for the response. Defaults to ``200`` for mixed method or ``GET``, ``PUT`` and
                 ``PATCH``, ``201`` for ``POST`` and ``204`` for ``DELETE``.
             sync_to_thread: A boolean dictating whether the handler function will be executed in a worker thread or the
@@ -763,6 +786,7 @@ class patch(HTTPRouteHandler):
             return_dto=return_dto,
             security=security,
             signature_namespace=signature_namespace,
+            static_response=static_response,
             status_code=status_code,
             summary=summary,
             sync_to_thread=sync_to_thread,
@@ -808,6 +832,7 @@ class post(HTTPRouteHandler):
         response_headers: ResponseHeaders | None = None,
         return_dto: type[AbstractDTO] | None | EmptyType = Empty,
         signature_namespace: Mapping[str, Any] | None = None,
+        static_response: bool = False,
         status_code: int | None = None,
         sync_to_thread: bool | None = None,
         # OpenAPI related attributes
@@ -877,6 +902,10 @@ class post(HTTPRouteHandler):
             return_dto: :class:`AbstractDTO <.dto.base_dto.AbstractDTO>` to use for serializing
                 outbound response data.
             signature_namespace: A mapping of names to types for use in forward reference resolution during signature modelling.
+            static_response: Opt in to replaying the first response of the handler, instead of calling the handler
+                function for every request. Only takes effect if the function takes no parameters and consists of a
+                single ``return`` of literal values or of a :class:`Response <.response.Response>` built from literal
+                values, and if no hooks, caching, background tasks, return DTO or custom response class apply.
             status_code: An http status code for the response. Defaults to ``200`` for mixed method or ``GET``, ``PUT`` and
                 ``PATCH``, ``201`` for ``POST`` and ``204`` for ``DELETE``.
             sync_to_thread: A boolean dictating whether the handler function will be executed in a worker thread or the
@@ -938,6 +967,7 @@ class post(HTTPRouteHandler):
             return_dto=return_dto,
             signature_namespace=signature_namespace,
             security=security,
+            static_response=static_response,
             status_code=status_code,
             summary=summary,
             sync_to_thread=sync_to_thread,
@@ -983,6 +1013,7 @@ class put(HTTPRouteHandler):
         response_headers: ResponseHeaders | None = None,
         return_dto: type[AbstractDTO] | None | EmptyType = Empty,
         signature_namespace: Mapping[str, Any] | None = None,
+        static_response: bool = False,
         status_code: int | None = None,
         sync_to_thread: bool | None = None,
         # OpenAPI related attributes
@@ -1052,6 +1083,10 @@ class put(HTTPRouteHandler):
             return_dto: :class:`AbstractDTO <.dto.base_dto.AbstractDTO>` to use for serializing
                 outbound response data.
             signature_namespace: A mapping of names to types for use in forward reference resolution during signature modelling.
+            static_response: Opt in to replaying the first response of the handler, instead of calling the handler
+                function for every request. Only takes effect if the function takes no parameters and consists of a
+                single ``return`` of literal values or of a :class:`Response <.response.Response>` built from literal
+                values, and if no hooks, caching, background tasks, return DTO or custom response class apply.
             status_code: An http status code for the response. Defaults to ``200`` for mixed method or ``GET``, ``PUT`` and
                 ``PATCH``, ``201`` for ``POST`` and ``204`` for ``DELETE``.
             sync_to_thread: A boolean dictating whether the handler function will be executed in a worker thread or the
@@ -1113,6 +1148,7 @@ class put(HTTPRouteHandler):
             return_dto=return_dto,
             security=security,
             signature_namespace=signature_namespace,
+            static_response=static_response,
             status_code=status_code,
             summary=summary,
             sync_to_thread=sync_to_thread,
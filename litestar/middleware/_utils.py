@@ -26,7 +26,7 @@ def build_exclude_path_pattern(*, exclude: str | list[str] | None = None) -> Pat
 
     try:
         return re.compile("|".join(exclude)) if isinstance(exclude, list) else re.compile(exclude)
-    except re.error as e:  # pragma: no cover
+    except re.error as e:
         raise ImproperlyConfiguredException(
             "Unable to compile exclude patterns for middleware. Please make sure you passed a valid regular expression."
         ) from e
@@ -63,7 +63,7 @@ def should_bypass_middleware(
 
     return bool(
         exclude_path_pattern
-        and exclude_path_pattern.findall(
+        and exclude_path_pattern.search(
             scope["raw_path"].decode() if getattr(scope.get("route_handler", {}), "is_mount", False) else scope["path"]
         )
     )
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, cast
 
 from msgspec.msgpack import decode as _decode_msgpack_plain
 
+from litestar.constants import HTTP_RESPONSE_BODY
 from litestar.datastructures.upload_file import UploadFile
 from litestar.enums import HttpMethod, MediaType, ScopeType
 from litestar.exceptions import ClientException, ImproperlyConfiguredException, SerializationException
@@ -19,13 +20,14 @@ if TYPE_CHECKING:
     from litestar._kwargs import KwargsModel
     from litestar._kwargs.cleanup import DependencyCleanupGroup
     from litestar.connection import Request
-    from litestar.types import ASGIApp, HTTPScope, Method, Receive, Scope, Send
+    from litestar.types import ASGIApp, HTTPScope, Message, Method, Receive, Scope, Send
 
 
 class HTTPRoute(BaseRoute):
     """An HTTP route, capable of handling multiple ``HTTPRouteHandler``\\ s."""  # noqa: D301
 
     __slots__ = (
+        "_static_response_messages",
         "route_handler_map",
         "route_handlers",
     )
@@ -51,6 +53,7 @@ class HTTPRoute(BaseRoute):
 
         self.route_handlers = route_handlers
         self.route_handler_map: dict[Method, tuple[HTTPRouteHandler, KwargsModel]] = {}
+        self._static_response_messages: dict[Method, tuple[Message, ...]] = {}
 
         super().__init__(
             methods=methods,
@@ -77,11 +80,18 @@ class HTTPRoute(BaseRoute):
         if route_handler.resolve_guards():
             await route_handler.authorize_connection(connection=request)
 
-        response = await self._get_response_for_request(
-            scope=scope, request=request, route_handler=route_handler, parameter_model=parameter_model
-        )
+        if static_messages := self._static_response_messages.get(scope["method"]):
+            for message in static_messages:
+                await send(_copy_message(message))
+        else:
+            response = await self._get_response_for_request(
+                scope=scope, request=request, route_handler=route_handler, parameter_model=parameter_model
+            )
 
-        await response(scope, receive, send)
+            if route_handler.has_static_response:
+                send = self._create_static_response_recorder(method=scope["method"], send=send)
+
+            await response(scope, receive, send)
 
         if after_response_handler := route_handler.resolve_after_response():
             await after_response_handler(request)
@@ -102,6 +112,29 @@ class HTTPRoute(BaseRoute):
                     )
                 self.route_handler_map[http_method] = (route_handler, kwargs_model)
 
+    def _create_static_response_recorder(self, method: Method, send: Send) -> Send:
+        """Wrap ``send`` to record the messages of a static response, so they can be replayed for later requests.
+
+        Only responses consisting of exactly one start and one body message are recorded.
+
+        Args:
+            method: The HTTP method of the request.
+            send: The ASGI send function.
+
+        Returns:
+            A wrapped ASGI send function.
+        """
+        messages: list[Message] = []
+
+        async def recording_send(message: Message) -> None:
+            # copy before sending, as middlewares further up the stack may mutate the message in place
+            messages.append(_copy_message(message))
+            if message["type"] == HTTP_RESPONSE_BODY and not message.get("more_body", False) and len(messages) == 2:
+                self._static_response_messages[method] = tuple(messages)
+            await send(message)
+
+        return recording_send
+
     async def _get_response_for_request(
         self,
         scope: Scope,
@@ -272,3 +305,18 @@ class HTTPRoute(BaseRoute):
         for v in form_data.values():
             if isinstance(v, UploadFile) and not v.file.closed:
                 await v.close()
+
+
+def _copy_message(message: Message) -> Message:
+    """Create a copy of an ASGI message that is safe to pass to ``send``.
+
+    Args:
+        message: An ASGI message.
+
+    Returns:
+        A copy of the message, including a copy of its headers, if any.
+    """
+    copied = cast("dict[str, Any]", dict(message))
+    if "headers" in copied:
+        copied["headers"] = list(copied["headers"])
+    return cast("Message", copied)
@@ -6,6 +6,7 @@ from dataclasses import field
 from typing import TYPE_CHECKING, Any, Callable, Generic, Iterable, Sequence, TypeVar, cast
 
 from litestar import Response
+from litestar.middleware._utils import build_exclude_path_pattern
 from litestar.utils.sync import ensure_async_callable
 
 if TYPE_CHECKING:
@@ -84,20 +85,42 @@ class AbstractSecurityConfig(ABC, Generic[UserType, AuthType]):
             The :class:`AppConfig <.config.app.AppConfig>`.
         """
         app_config.middleware.insert(0, self.middleware)
+        self._update_app_config(app_config)
+        return app_config
 
-        if app_config.openapi_config:
-            app_config.openapi_config = copy(app_config.openapi_config)
-            if isinstance(app_config.openapi_config.components, list):
-                app_config.openapi_config.components.append(self.openapi_components)
-            elif app_config.openapi_config.components:
-                app_config.openapi_config.components = [self.openapi_components, app_config.openapi_config.components]
-            else:
-                app_config.openapi_config.components = [self.openapi_components]
+    @staticmethod
+    def batch_on_app_init(configs: Iterable[AbstractSecurityConfig[Any, Any]], app_config: AppConfig) -> AppConfig:
+        """Handle app init for several security configs at once. This method can be used only on the app level.
+
+        The result is equivalent to calling :meth:`on_app_init` of each config in the given order, but the middlewares
+        of all configs are inserted into the app's middleware stack with a single operation.
+
+        Args:
+            configs: An iterable of security configs.
+            app_config: An instance of :class:`AppConfig <.config.app.AppConfig>`
+
+        Returns:
+            The :class:`AppConfig <.config.app.AppConfig>`.
+        """
+        configs = list(configs)
+        app_config.middleware[:0] = [config.middleware for config in reversed(configs)]
+        for config in configs:
+            config._update_app_config(app_config)
+        return app_config
 
-            if isinstance(app_config.openapi_config.security, list):
-                app_config.openapi_config.security.append(self.security_requirement)
+    def _update_app_config(self, app_config: AppConfig) -> None:
+        if openapi_config := app_config.openapi_config:
+            if isinstance(openapi_config.components, list):
+                components = [*openapi_config.components, self.openapi_components]
+            elif openapi_config.components:
+                components = [self.openapi_components, openapi_config.components]
             else:
-                app_config.openapi_config.security = [self.security_requirement]
+                components = [self.openapi_components]
+
+            # the config may be shared with other apps, so the updated values are set on a shallow copy of it
+            app_config.openapi_config = copy(openapi_config)
+            app_config.openapi_config.components = components
+            app_config.openapi_config.security = [*(openapi_config.security or ()), self.security_requirement]
 
         if self.guards:
             app_config.guards.extend(self.guards)
@@ -111,8 +134,6 @@ class AbstractSecurityConfig(ABC, Generic[UserType, AuthType]):
         if self.type_encoders is None:
             self.type_encoders = app_config.type_encoders
 
-        return app_config
-
     def create_response(
         self,
         content: Any | None,
@@ -147,6 +168,8 @@ class AbstractSecurityConfig(ABC, Generic[UserType, AuthType]):
 
     def __post_init__(self) -> None:
         self.retrieve_user_handler = ensure_async_callable(self.retrieve_user_handler)
+        # validate the exclude patterns up front, so invalid patterns are reported when the config is created
+        build_exclude_path_pattern(exclude=self.exclude)
 
     @property
     @abstractmethod
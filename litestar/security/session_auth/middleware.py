@@ -21,6 +21,8 @@ if TYPE_CHECKING:
 class MiddlewareWrapper:
     """Wrapper class that serves as the middleware entry point."""
 
+    __slots__ = ("app", "config", "has_wrapped_middleware")
+
     def __init__(self, app: ASGIApp, config: SessionAuth[Any, Any]) -> None:
         """Wrap the SessionAuthMiddleware inside ExceptionHandlerMiddleware, and it wraps this inside SessionMiddleware.
         This allows the auth middleware to raise exceptions and still have the response handled, while having the
@@ -66,6 +68,8 @@ class MiddlewareWrapper:
 class SessionAuthMiddleware(AbstractAuthenticationMiddleware):
     """Session Authentication Middleware."""
 
+    __slots__ = ("retrieve_user_handler",)
+
     def __init__(
         self,
         app: ASGIApp,
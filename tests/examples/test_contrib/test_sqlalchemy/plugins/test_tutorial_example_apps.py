@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import importlib
 import sys
+from typing import Any
 
 import pytest
 from _pytest.fixtures import FixtureRequest
@@ -9,6 +10,7 @@ from _pytest.monkeypatch import MonkeyPatch
 from docs.examples.contrib.sqlalchemy.plugins.tutorial import (
     full_app_no_plugins,
     full_app_with_init_plugin,
+    full_app_with_performance_tuning,
     full_app_with_plugin,
     full_app_with_serialization_plugin,
     full_app_with_session_di,
@@ -25,6 +27,7 @@ pytestmark = pytest.mark.xdist_group("sqlalchemy_examples")
     params=[
         full_app_no_plugins,
         full_app_with_init_plugin,
+        full_app_with_performance_tuning,
         full_app_with_plugin,
         full_app_with_serialization_plugin,
         full_app_with_session_di,
@@ -75,3 +78,61 @@ def test_no_plugins_full_app(app: Litestar) -> None:
         response = client.put("/Start writing todo list", json=updated_todo)
         assert response.status_code == 200
         assert response.json() == updated_todo
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Unknown - fails on Windows and macOS, in CI only")
+@pytest.mark.parametrize("app", [full_app_with_performance_tuning], indirect=True)
+def test_performance_tuning_app_bulk_add(app: Litestar) -> None:
+    todos = [{"title": "Start writing todo list", "done": True}, {"title": "Finish writing todo list", "done": False}]
+
+    with TestClient(app) as client:
+        response = client.post("/", json=todos)
+        assert response.status_code == 201
+        assert response.json() == todos
+
+        response = client.post("/", json=[])
+        assert response.status_code == 201
+        assert response.json() == []
+
+        response = client.post("/", json=todos[:1])
+        assert response.status_code == 409
+
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.json() == todos
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Unknown - fails on Windows and macOS, in CI only")
+@pytest.mark.parametrize("app", [full_app_with_performance_tuning], indirect=True)
+def test_performance_tuning_app_list_cache(app: Litestar, monkeypatch: MonkeyPatch) -> None:
+    get_todo_list = full_app_with_performance_tuning.get_todo_list
+    queries = []
+
+    async def counting_get_todo_list(*args: Any, **kwargs: Any) -> Any:
+        queries.append(args)
+        return await get_todo_list(*args, **kwargs)
+
+    monkeypatch.setattr(full_app_with_performance_tuning, "get_todo_list", counting_get_todo_list)
+    todo = {"title": "Start writing todo list", "done": True}
+    updated_todo = {"title": "Start writing todo list", "done": False}
+
+    with TestClient(app) as client:
+        for _ in range(3):
+            response = client.get("/")
+            assert response.status_code == 200
+            assert response.json() == []
+        assert len(queries) == 1
+
+        response = client.post("/", json=todo)
+        assert response.status_code == 201
+
+        response = client.get("/")
+        assert response.json() == [todo]
+        assert len(queries) == 2
+
+        response = client.put("/Start writing todo list", json=updated_todo)
+        assert response.status_code == 200
+
+        response = client.get("/")
+        assert response.json() == [updated_todo]
+        assert len(queries) == 3
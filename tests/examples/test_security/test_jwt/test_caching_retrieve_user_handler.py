@@ -0,0 +1,35 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+from docs.examples.security.jwt import caching_retrieve_user_handler
+from docs.examples.security.jwt.caching_retrieve_user_handler import app
+
+from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED
+from litestar.testing import TestClient
+
+
+def test_caching_retrieve_user_handler() -> None:
+    with TestClient(app) as client, patch.object(
+        caching_retrieve_user_handler,
+        "get_user_from_db",
+        wraps=caching_retrieve_user_handler.get_user_from_db,
+    ) as get_user_from_db_mock:
+        response = client.post(
+            "/login", json={"name": "Moishe Zuchmir", "email": "moishe@zuchmir.com", "id": str(uuid4())}
+        )
+        assert response.status_code == HTTP_201_CREATED
+        headers = {"Authorization": response.headers["authorization"]}
+
+        for _ in range(3):
+            response = client.get("/some-path", headers=headers)
+            assert response.status_code == HTTP_200_OK
+            assert response.json() == {"name": "Moishe Zuchmir"}
+        assert get_user_from_db_mock.call_count == 1
+
+        user = {"name": "Moishe Zuchmir-Levi", "email": "moishe@zuchmir.com", "id": str(uuid4())}
+        response = client.put("/me", json=user, headers=headers)
+        assert response.status_code == HTTP_200_OK
+        response = client.get("/some-path", headers=headers)
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == {"name": "Moishe Zuchmir-Levi"}
+        assert get_user_from_db_mock.call_count == 2
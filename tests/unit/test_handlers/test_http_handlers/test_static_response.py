@@ -0,0 +1,188 @@
+from functools import wraps
+from typing import Any, Callable, Dict
+
+import pytest
+
+from litestar import HttpMethod, Litestar, MediaType, Request, Response, get, post
+from litestar.handlers.http_handlers._utils import is_static_response_fn
+from litestar.middleware import AbstractMiddleware
+from litestar.response.base import ASGIResponse
+from litestar.testing import create_test_client
+from litestar.types import Message, Receive, Scope, Send
+
+
+def literal_fn() -> Dict[str, Any]:
+    return {"greeting": "hello", "values": [1, -2, [3.5, None]], "nested": {"ok": True}}
+
+
+def literal_with_docstring_fn() -> str:
+    """Docstring."""
+    return "hello"
+
+
+def response_fn() -> Response[str]:
+    return Response("hello", status_code=202, headers={"x-static": "1"})
+
+
+def bare_return_fn() -> None:
+    return
+
+
+GREETING = "hello"
+
+
+def name_fn() -> str:
+    return GREETING
+
+
+def non_literal_fn() -> str:
+    return str(1)
+
+
+def tuple_fn() -> tuple:
+    return (1, -2.5, "three")
+
+
+def non_literal_response_fn() -> Response[str]:
+    return Response(str(1))
+
+
+def identity_fn(data: str) -> str:
+    return data
+
+
+def make_shadowed_response_fn() -> Callable[[], Any]:
+    class Response:
+        def __init__(self, content: Any) -> None:
+            self.content = content
+
+    def shadowed_response_fn() -> Any:
+        return Response("hello")
+
+    return shadowed_response_fn
+
+
+class SequenceResponse(Response):
+    sequence = 0
+
+    def to_asgi_response(self, *args: Any, **kwargs: Any) -> ASGIResponse:
+        self.headers["x-seq"] = str(SequenceResponse.sequence)
+        SequenceResponse.sequence += 1
+        return super().to_asgi_response(*args, **kwargs)
+
+
+def count_calls(fn: Callable[[], Any]) -> Callable[[], Any]:
+    @wraps(fn)
+    def wrapper() -> Any:
+        wrapper.call_count += 1  # type: ignore[attr-defined]
+        return fn()
+
+    wrapper.call_count = 0  # type: ignore[attr-defined]
+    return wrapper
+
+
+@count_calls
+def wrapped_literal_fn() -> str:
+    return "hello"
+
+
+@pytest.mark.parametrize(
+    "fn, expected",
+    [
+        (literal_fn, True),
+        (literal_with_docstring_fn, True),
+        (response_fn, True),
+        (bare_return_fn, True),
+        (tuple_fn, True),
+        (name_fn, False),
+        (non_literal_fn, False),
+        (non_literal_response_fn, False),
+        (identity_fn, False),
+        (make_shadowed_response_fn(), False),
+        (wrapped_literal_fn, False),
+        (lambda: "hello", False),
+        (print, False),
+    ],
+)
+def test_is_static_response_fn(fn: Any, expected: bool) -> None:
+    assert is_static_response_fn(fn) is expected
+
+
+@pytest.mark.parametrize(
+    "handler_kwargs, expected",
+    [
+        ({}, False),
+        ({"static_response": True}, True),
+        ({"static_response": True, "cache": True}, False),
+        ({"static_response": True, "before_request": lambda request: None}, False),
+        ({"static_response": True, "after_request": lambda response: response}, False),
+        ({"static_response": True, "response_class": SequenceResponse}, False),
+    ],
+)
+def test_has_static_response(handler_kwargs: Dict[str, Any], expected: bool) -> None:
+    app = Litestar([get("/", sync_to_thread=False, **handler_kwargs)(literal_fn)])
+    route_handler, _ = app.routes[0].route_handler_map[HttpMethod.GET]  # type: ignore[union-attr]
+    assert route_handler.has_static_response is expected
+
+
+def test_has_static_response_with_parameters() -> None:
+    app = Litestar([post("/", sync_to_thread=False, static_response=True)(identity_fn)])
+    route_handler, _ = app.routes[0].route_handler_map[HttpMethod.POST]  # type: ignore[union-attr]
+    assert route_handler.has_static_response is False
+
+
+def test_static_response_is_replayed() -> None:
+    call_count = 0
+
+    def after_response(request: Request) -> None:
+        nonlocal call_count
+        call_count += 1
+
+    handler = get("/", sync_to_thread=False, media_type=MediaType.JSON, static_response=True)(response_fn)
+
+    with create_test_client(handler, after_response=after_response) as client:
+        for _ in range(3):
+            response = client.get("/")
+            assert response.status_code == 202
+            assert response.text == "hello"
+            assert response.headers["x-static"] == "1"
+
+    assert call_count == 3
+
+
+def test_static_response_is_not_mutated_by_middleware() -> None:
+    class HeaderMiddleware(AbstractMiddleware):
+        async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+            async def wrapped_send(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    message["headers"].append((b"x-extra", b"1"))  # type: ignore[union-attr]
+                await send(message)
+
+            await self.app(scope, receive, wrapped_send)
+
+    handler = get("/", sync_to_thread=False, static_response=True)(literal_fn)
+
+    with create_test_client(handler, middleware=[HeaderMiddleware]) as client:
+        for _ in range(3):
+            response = client.get("/")
+            assert response.json() == literal_fn()
+            assert response.headers.get_list("x-extra") == ["1"]
+
+
+def test_wrapped_static_response_fn_is_called_for_every_request() -> None:
+    handler = get("/", sync_to_thread=False, static_response=True)(wrapped_literal_fn)
+
+    with create_test_client(handler) as client:
+        for _ in range(3):
+            assert client.get("/").text == "hello"
+
+    assert wrapped_literal_fn.call_count == 3  # type: ignore[attr-defined]
+
+
+def test_static_response_not_replayed_with_custom_response_class() -> None:
+    handler = get("/", sync_to_thread=False, static_response=True)(literal_fn)
+
+    with create_test_client(handler, response_class=SequenceResponse) as client:
+        headers = [client.get("/").headers["x-seq"] for _ in range(3)]
+
+    assert headers == ["0", "1", "2"]
@@ -186,6 +186,31 @@ def test_generator_dependency_nested(
         exception_mock.assert_not_called()
 
 
+def test_generator_dependency_nested_shares_value_per_request() -> None:
+    values = []
+
+    async def dependency() -> AsyncGenerator[object, None]:
+        value = object()
+        values.append(value)
+        yield value
+
+    async def nested_dependency(generator_dep: object) -> object:
+        return generator_dep
+
+    @get("/", dependencies={"generator_dep": dependency, "nested": nested_dependency})
+    async def handler(generator_dep: object, nested: object) -> Dict[str, bool]:
+        return {"same": generator_dep is nested}
+
+    with create_test_client(route_handlers=[handler]) as client:
+        for _ in range(2):
+            res = client.get("/")
+            assert res.status_code == 200
+            assert res.json() == {"same": True}
+
+    assert len(values) == 2
+    assert values[0] is not values[1]
+
+
 @pytest.mark.parametrize("dependency_fixture", ["generator_dependency", "async_generator_dependency"])
 def test_generator_dependency_nested_error_during_cleanup(
     request: FixtureRequest,
@@ -2,17 +2,22 @@ from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import pytest
 
-from litestar import get
+from litestar import Litestar, get
+from litestar.config.app import AppConfig
 from litestar.di import Provide
+from litestar.exceptions import ImproperlyConfiguredException
 from litestar.middleware.session.server_side import (
     ServerSideSessionBackend,
     ServerSideSessionConfig,
 )
 from litestar.openapi.config import OpenAPIConfig
 from litestar.openapi.spec import Components, SecurityScheme
+from litestar.security.base import AbstractSecurityConfig
+from litestar.security.jwt import JWTAuth
 from litestar.security.session_auth import SessionAuth
 from litestar.status_codes import HTTP_200_OK
 from litestar.testing import create_test_client
+from litestar.utils.sync import AsyncCallable
 
 if TYPE_CHECKING:
     from litestar.connection import ASGIConnection
@@ -187,3 +192,70 @@ def test_abstract_security_config_setting_openapi_security_requirements(
             assert client.app.openapi_config.security == expected
         else:
             assert not client.app.openapi_config
+
+
+def test_abstract_security_config_does_not_mutate_openapi_config(
+    session_backend_config_memory: ServerSideSessionConfig,
+) -> None:
+    components = [Components(security_schemes={"app": SecurityScheme(type="http", name="test")})]
+    security = [{"app": []}]
+    openapi_config = OpenAPIConfig(title="Litestar API", version="1.0.0", components=components, security=security)
+    security_config = SessionAuth[Any, ServerSideSessionBackend](
+        retrieve_user_handler=retrieve_user_handler, session_backend_config=session_backend_config_memory
+    )
+
+    with create_test_client([], on_app_init=[security_config.on_app_init], openapi_config=openapi_config) as client:
+        assert client.app.openapi_config is not openapi_config
+        assert client.app.openapi_config.security == [{"app": []}, {"sessionCookie": []}]  # type: ignore[union-attr]
+
+    assert openapi_config.components is components
+    assert len(components) == 1
+    assert security == [{"app": []}]
+
+
+def test_abstract_security_config_wraps_only_sync_retrieve_user_handler(
+    session_backend_config_memory: ServerSideSessionConfig,
+) -> None:
+    async def async_retrieve_user_handler(_: Dict[str, Any], __: "ASGIConnection") -> Any:
+        pass
+
+    async_security_config = SessionAuth[Any, ServerSideSessionBackend](
+        retrieve_user_handler=async_retrieve_user_handler, session_backend_config=session_backend_config_memory
+    )
+    sync_security_config = SessionAuth[Any, ServerSideSessionBackend](
+        retrieve_user_handler=retrieve_user_handler, session_backend_config=session_backend_config_memory
+    )
+
+    assert async_security_config.retrieve_user_handler is async_retrieve_user_handler
+    assert isinstance(sync_security_config.retrieve_user_handler, AsyncCallable)
+    assert sync_security_config.retrieve_user_handler.func is retrieve_user_handler
+
+
+def test_abstract_security_config_validates_exclude_patterns(
+    session_backend_config_memory: ServerSideSessionConfig,
+) -> None:
+    with pytest.raises(ImproperlyConfiguredException):
+        SessionAuth[Any, ServerSideSessionBackend](
+            retrieve_user_handler=retrieve_user_handler,
+            session_backend_config=session_backend_config_memory,
+            exclude=["/ok", "/invalid["],
+        )
+
+
+def test_abstract_security_config_batch_on_app_init(session_backend_config_memory: ServerSideSessionConfig) -> None:
+    session_auth = SessionAuth[Any, ServerSideSessionBackend](
+        retrieve_user_handler=retrieve_user_handler, session_backend_config=session_backend_config_memory
+    )
+    jwt_auth = JWTAuth[Any](retrieve_user_handler=retrieve_user_handler, token_secret="abc123")
+
+    def batch_on_app_init(app_config: AppConfig) -> AppConfig:
+        return AbstractSecurityConfig.batch_on_app_init([session_auth, jwt_auth], app_config)
+
+    app = Litestar(on_app_init=[session_auth.on_app_init, jwt_auth.on_app_init])
+    batch_app = Litestar(on_app_init=[batch_on_app_init])
+
+    assert [middleware.middleware for middleware in batch_app.middleware] == [
+        middleware.middleware for middleware in app.middleware
+    ]
+    assert batch_app.openapi_config.security == app.openapi_config.security  # type: ignore[union-attr]
+    assert batch_app.openapi_config.components == app.openapi_config.components  # type: ignore[union-attr]